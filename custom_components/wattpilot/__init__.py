@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Final
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_integration
 
 from .const import (
@@ -26,19 +29,92 @@ from .utils import (
     PropertyUpdateHandler,
     async_ConnectCharger,
     async_DisconnectCharger,
+    async_PreloadPlatformYaml,
     wattpilot,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.helpers.typing import ConfigType
+
 _LOGGER: Final = logging.getLogger(__name__)
 
+CONFIG_SCHEMA: Final = cv.config_entry_only_config_schema(DOMAIN)
+
+# Platforms reading their static yaml configuration through async_GetPlatformYaml
+_YAML_PLATFORMS: Final = (
+    "button",
+    "number",
+    "select",
+    "sensor",
+    "switch",
+    "update",
+)
+
+# Integration version, looked up once per process ("" if it could not be determined)
+_INTEGRATION_VERSION: str | None = None
+_INTEGRATION_VERSION_LOCK: Final = asyncio.Lock()
+
+
+async def _async_get_integration_version(hass: HomeAssistant, entry_id: str) -> str:
+    """Async: return the integration version, cached across config entries."""
+    global _INTEGRATION_VERSION  # noqa: PLW0603
+    if _INTEGRATION_VERSION is not None:
+        return _INTEGRATION_VERSION
+    async with _INTEGRATION_VERSION_LOCK:
+        if _INTEGRATION_VERSION is None:
+            try:
+                integration = await async_get_integration(hass, DOMAIN)
+                _INTEGRATION_VERSION = integration.version or ""
+            except Exception:
+                _LOGGER.warning(
+                    "%s - async_setup_entry: Unable to determine %s integration version",
+                    entry_id,
+                    DOMAIN,
+                )
+                _INTEGRATION_VERSION = ""
+    return _INTEGRATION_VERSION
+
+
+def _property_event_handler(
+    property_callback: Callable[[str, Any], None],
+    _event: Any,
+    identifier: str,
+    value: Any,
+) -> None:
+    """Forward a wattpilot property event to the property update callback."""
+    property_callback(identifier, value)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the integration services once for all config entries."""
+    # Parse the static platform configurations while the chargers connect
+    hass.async_create_task(async_PreloadPlatformYaml(hass, _YAML_PLATFORMS))
+
+    _LOGGER.debug("%s - async_setup: register services", DOMAIN)
+    await asyncio.gather(
+        async_registerService(
+            hass, "disconnect_charger", async_service_DisconnectCharger
+        ),
+        async_registerService(
+            hass, "reconnect_charger", async_service_ReConnectCharger
+        ),
+        async_registerService(hass, "set_goe_cloud", async_service_SetGoECloud),
+        async_registerService(
+            hass, "set_debug_properties", async_service_SetDebugProperties
+        ),
+        async_registerService(hass, "set_next_trip", async_service_SetNextTrip),
+    )
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: WattpilotConfigEntry) -> bool:
     """Set up a charger from the config entry."""
     _LOGGER.debug("Setting up config entry: %s", entry.entry_id)
 
-    try:
-        integration = await async_get_integration(hass, DOMAIN)
-        version = integration.version
+    version = await _async_get_integration_version(hass, entry.entry_id)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
         if version:
             _LOGGER.debug(
                 "%s - async_setup_entry: %s integration version: %s",
@@ -52,12 +128,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: WattpilotConfigEntry) ->
                 entry.entry_id,
                 DOMAIN,
             )
-    except Exception:
-        _LOGGER.warning(
-            "%s - async_setup_entry: Unable to determine %s integration version",
-            entry.entry_id,
-            DOMAIN,
-        )
 
     # Connect to the charger
     try:
@@ -70,146 +140,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: WattpilotConfigEntry) ->
     except ConfigEntryNotReady:
         raise
     except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry: Connecting charger failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
+        _LOGGER.exception(
+            "%s - async_setup_entry: Connecting charger failed", entry.entry_id
         )
         raise ConfigEntryNotReady(f"Failed to connect to charger: {e}") from e
 
-    # Set up runtime data using the modern pattern
+    # Set up runtime data, listeners and platforms - disconnect again on any failure
     try:
-        _LOGGER.debug(
-            "%s - async_setup_entry: Creating runtime data",
-            entry.entry_id,
-        )
-        entry.runtime_data = WattpilotRuntimeData(
+        _LOGGER.debug("%s - async_setup_entry: Creating runtime data", entry.entry_id)
+        runtime_data = WattpilotRuntimeData(
             charger=charger,
             push_entities={},
-            params=dict(entry.data),
+            params=entry.data,
             debug_properties=False,
         )
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry: Creating runtime data failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        await async_DisconnectCharger(entry.entry_id, charger)
-        raise ConfigEntryNotReady(f"Failed to create runtime data: {e}") from e
+        entry.runtime_data = runtime_data
 
-    # Register option updates listener
-    try:
         _LOGGER.debug(
             "%s - async_setup_entry: Register option updates listener",
             entry.entry_id,
         )
-        entry.runtime_data.options_update_listener = entry.add_update_listener(
-            options_update_listener
-        )
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry: Register option updates listener failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        await async_DisconnectCharger(entry.entry_id, charger)
-        raise ConfigEntryNotReady(
-            f"Failed to register option updates listener: {e}"
-        ) from e
+        entry.async_on_unload(entry.add_update_listener(options_update_listener))
 
-    # Forward setup to platforms
-    try:
         _LOGGER.debug(
-            "%s - async_setup_entry: Trigger setup for platforms",
-            entry.entry_id,
+            "%s - async_setup_entry: Trigger setup for platforms", entry.entry_id
         )
         await hass.config_entries.async_forward_entry_setups(entry, SUPPORTED_PLATFORMS)
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry: Setup trigger failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        await async_DisconnectCharger(entry.entry_id, charger)
-        raise ConfigEntryNotReady(f"Failed to setup platforms: {e}") from e
 
-    # Register property update handler
-    try:
         _LOGGER.debug(
             "%s - async_setup_entry: register properties update handler",
             entry.entry_id,
         )
-        if hasattr(charger, "register_property_callback") and callable(
-            charger.register_property_callback
-        ):
-            charger.register_property_callback(
-                lambda identifier, value: PropertyUpdateHandler(
-                    hass, entry.entry_id, identifier, value
-                )
+        property_callback = partial(
+            PropertyUpdateHandler, hass, entry.entry_id, runtime_data
+        )
+        register_property_callback = getattr(
+            charger, "register_property_callback", None
+        )
+        add_event_handler = getattr(charger, "add_event_handler", None)
+        if callable(register_property_callback):
+            register_property_callback(property_callback)
+            unregister_property_callback = getattr(
+                charger, "unregister_property_callback", None
             )
-        elif hasattr(charger, "add_event_handler") and callable(
-            charger.add_event_handler
-        ):
-            entry.runtime_data.property_updates_callback = (
-                lambda _, identifier, value: PropertyUpdateHandler(
-                    hass, entry.entry_id, identifier, value
+            if callable(unregister_property_callback):
+                entry.async_on_unload(unregister_property_callback)
+        elif callable(add_event_handler):
+            event_callback = partial(_property_event_handler, property_callback)
+            add_event_handler(wattpilot.Event.WP_PROPERTY, event_callback)
+            remove_event_handler = getattr(charger, "remove_event_handler", None)
+            if callable(remove_event_handler):
+                entry.async_on_unload(
+                    partial(
+                        remove_event_handler,
+                        wattpilot.Event.WP_PROPERTY,
+                        event_callback,
+                    )
                 )
-            )
-            charger.add_event_handler(
-                wattpilot.Event.WP_PROPERTY,
-                entry.runtime_data.property_updates_callback,
-            )
         else:
             _LOGGER.warning(
                 "%s - async_setup_entry: charger does not provide properties updater handler",
                 entry.entry_id,
             )
     except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry: Could not register properties updater handler: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
+        _LOGGER.exception("%s - async_setup_entry: Setup failed", entry.entry_id)
         await async_DisconnectCharger(entry.entry_id, charger)
-        raise ConfigEntryNotReady(
-            f"Failed to register property update handler: {e}"
-        ) from e
-
-    # Register services
-    try:
-        _LOGGER.debug("%s - async_setup_entry: register services", entry.entry_id)
-        await async_registerService(
-            hass, "disconnect_charger", async_service_DisconnectCharger
-        )
-        await async_registerService(
-            hass, "reconnect_charger", async_service_ReConnectCharger
-        )
-        await async_registerService(hass, "set_goe_cloud", async_service_SetGoECloud)
-        await async_registerService(
-            hass, "set_debug_properties", async_service_SetDebugProperties
-        )
-        await async_registerService(hass, "set_next_trip", async_service_SetNextTrip)
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry: register services failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        await async_DisconnectCharger(entry.entry_id, charger)
-        raise ConfigEntryNotReady(f"Failed to register services: {e}") from e
+        raise ConfigEntryNotReady(f"Failed to set up charger: {e}") from e
 
     _LOGGER.debug("%s - async_setup_entry: Completed", entry.entry_id)
     return True
@@ -224,22 +220,12 @@ async def options_update_listener(
             "%s - options_update_listener: update options and reload config entry",
             entry.entry_id,
         )
-
-        _LOGGER.debug("%s - options_update_listener: set new options", entry.entry_id)
-        entry.runtime_data.params = dict(entry.options)
+        entry.runtime_data.params = entry.options
         hass.config_entries.async_update_entry(entry, data=entry.options)
-
-        _LOGGER.debug(
-            "%s - options_update_listener: async_reload entry", entry.entry_id
-        )
         await hass.config_entries.async_reload(entry.entry_id)
-    except Exception as e:
-        _LOGGER.error(
-            "%s - options_update_listener: update options failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
+    except Exception:
+        _LOGGER.exception(
+            "%s - options_update_listener: update options failed", entry.entry_id
         )
 
 
@@ -254,52 +240,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: WattpilotConfigEntry) -
         )
 
         if unload_ok:
-            # Unload option updates listener
-            _LOGGER.debug(
-                "%s - async_unload_entry: Unload option updates listener",
-                entry.entry_id,
-            )
-            if entry.runtime_data.options_update_listener:
-                entry.runtime_data.options_update_listener()
-
+            # Property handlers are removed by the entry.async_on_unload callbacks
             charger = entry.runtime_data.charger
 
-            # Remove registered event handlers
-            try:
-                _LOGGER.debug(
-                    "%s - async_unload_entry: remove registered event handlers",
-                    entry.entry_id,
-                )
-                if hasattr(charger, "unregister_property_callback") and callable(
-                    charger.unregister_property_callback
-                ):
-                    charger.unregister_property_callback()
-                elif hasattr(charger, "remove_event_handler") and callable(
-                    charger.remove_event_handler
-                ):
-                    charger.remove_event_handler(
-                        wattpilot.Event.WP_PROPERTY,
-                        entry.runtime_data.property_updates_callback,
-                    )
-            except Exception as e:
-                _LOGGER.error(
-                    "%s - async_unload_entry: failed to remove event handlers: %s (%s.%s)",
-                    entry.entry_id,
-                    str(e),
-                    e.__class__.__module__,
-                    type(e).__name__,
-                )
-
             # Disconnect charger
             try:
                 await async_DisconnectCharger(entry.entry_id, charger)
-            except Exception as e:
-                _LOGGER.error(
-                    "%s - async_unload_entry: could not disconnect charger: %s (%s.%s)",
+            except Exception:
+                _LOGGER.exception(
+                    "%s - async_unload_entry: could not disconnect charger",
                     entry.entry_id,
-                    str(e),
-                    e.__class__.__module__,
-                    type(e).__name__,
                 )
                 _LOGGER.error(
                     "%s - async_unload_entry: session at charger %s (%s) stays open -> restart charger",
@@ -310,12 +260,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: WattpilotConfigEntry) -
 
         return unload_ok
 
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_unload_entry: Unload device failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
+    except Exception:
+        _LOGGER.exception(
+            "%s - async_unload_entry: Unload device failed", entry.entry_id
         )
         return False
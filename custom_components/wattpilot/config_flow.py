@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Final
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant import config_entries
 from homeassistant.components.diagnostics import async_redact_data
@@ -30,155 +31,159 @@ from .const import (
     DOMAIN,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    type _FlowStep = Callable[..., Coroutine[Any, Any, config_entries.ConfigFlowResult]]
+
 REDACT_CONFIG = {CONF_PASSWORD}
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 
+def _redact(user_input: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the user input with secrets redacted for logging."""
+    if user_input is None:
+        return None
+    return async_redact_data(user_input, REDACT_CONFIG)
+
+
+def _abort_on_exception(step: _FlowStep) -> _FlowStep:
+    """Abort the flow if a flow step fails."""
+
+    @wraps(step)
+    async def wrapper(
+        self: config_entries.ConfigEntryBaseFlow, *args: Any, **kwargs: Any
+    ) -> config_entries.ConfigFlowResult:
+        try:
+            return await step(self, *args, **kwargs)
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: %s failed",
+                DOMAIN,
+                type(self).__name__,
+                step.__name__,
+            )
+            return self.async_abort(reason="exception")
+
+    return wrapper
+
+
 class ConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Custom config flow."""
 
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_PUSH
-    data: dict[str, Any]
-    loaded_platforms: list[str] = []
 
     def __init__(self) -> None:
         """Initialize."""
         _LOGGER.debug("%s - ConfigFlowHandler: __init__", DOMAIN)
+        self.data: dict[str, Any] = {}
 
+    @_abort_on_exception
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Invoked when a user initiates a flow via the user interface."""
-        _LOGGER.debug(
-            "%s - ConfigFlowHandler: async_step_user: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            if not hasattr(self, "data"):
-                self.data = {}
-            return await self.async_step_connection()
-        except Exception as e:
-            _LOGGER.error(
-                "%s - ConfigFlowHandler: async_step_user failed: %s (%s.%s)",
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - ConfigFlowHandler: async_step_user: %s",
                 DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
+                _redact(user_input),
             )
-            return self.async_abort(reason="exception")
+        return await self.async_step_connection()
 
+    @_abort_on_exception
     async def async_step_connection(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Config flow to define a charger connection via user interface."""
-        _LOGGER.debug(
-            "%s - ConfigFlowHandler: async_step_connection: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            errors: dict[str, str] = {}
-            if user_input is not None:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - ConfigFlowHandler: async_step_connection: %s",
+                DOMAIN,
+                _redact(user_input),
+            )
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "%s - ConfigFlowHandler: async_step_connection add user_input to data: %s",
                     DOMAIN,
-                    async_redact_data(user_input, REDACT_CONFIG),
+                    _redact(user_input),
                 )
-                if user_input[CONF_CONNECTION] == CONF_LOCAL:
-                    return await self.async_step_local()
-                if user_input[CONF_CONNECTION] == CONF_CLOUD:
-                    return await self.async_step_cloud()
-            return self.async_show_form(
-                step_id=CONF_CONNECTION, data_schema=CONNECTION_SCHEMA, errors=errors
-            )
-        except Exception as e:
-            _LOGGER.error(
-                "%s - ConfigFlowHandler: async_step_connection failed: %s (%s.%s)",
-                DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
-            )
-            return self.async_abort(reason="exception")
+            step = {
+                CONF_LOCAL: self.async_step_local,
+                CONF_CLOUD: self.async_step_cloud,
+            }.get(user_input[CONF_CONNECTION])
+            if step is not None:
+                return await step()
+        return self.async_show_form(
+            step_id=CONF_CONNECTION, data_schema=CONNECTION_SCHEMA, errors=errors
+        )
 
+    @_abort_on_exception
     async def async_step_local(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Config flow to define a local charger connection via user interface."""
-        _LOGGER.debug(
-            "%s - ConfigFlowHandler: async_step_local: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            errors: dict[str, str] = {}
-            if user_input is not None:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - ConfigFlowHandler: async_step_local: %s",
+                DOMAIN,
+                _redact(user_input),
+            )
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "%s - ConfigFlowHandler: async_step_local add user_input to data: %s",
                     DOMAIN,
-                    async_redact_data(user_input, REDACT_CONFIG),
+                    _redact(user_input),
                 )
-                user_input[CONF_CONNECTION] = CONF_LOCAL
-                self.data = user_input
-                return await self.async_step_final()
-            return self.async_show_form(
-                step_id=CONF_LOCAL, data_schema=LOCAL_SCHEMA, errors=errors
-            )
-        except Exception as e:
-            _LOGGER.error(
-                "%s - ConfigFlowHandler: async_step_local failed: %s (%s.%s)",
-                DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
-            )
-            return self.async_abort(reason="exception")
+            user_input[CONF_CONNECTION] = CONF_LOCAL
+            self.data = user_input
+            return await self.async_step_final()
+        return self.async_show_form(
+            step_id=CONF_LOCAL, data_schema=LOCAL_SCHEMA, errors=errors
+        )
 
+    @_abort_on_exception
     async def async_step_cloud(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Config flow to define a cloud charger connection via user interface."""
-        _LOGGER.debug(
-            "%s - ConfigFlowHandler: async_step_cloud: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            errors: dict[str, str] = {}
-            if user_input is not None:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - ConfigFlowHandler: async_step_cloud: %s",
+                DOMAIN,
+                _redact(user_input),
+            )
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "%s - ConfigFlowHandler: async_step_cloud add user_input to data: %s",
                     DOMAIN,
-                    async_redact_data(user_input, REDACT_CONFIG),
+                    _redact(user_input),
                 )
-                user_input[CONF_CONNECTION] = CONF_CLOUD
-                self.data = user_input
-                return await self.async_step_final()
-            return self.async_show_form(
-                step_id=CONF_CLOUD, data_schema=CLOUD_SCHEMA, errors=errors
-            )
-        except Exception as e:
-            _LOGGER.error(
-                "%s - ConfigFlowHandler: async_step_cloud failed: %s (%s.%s)",
-                DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
-            )
-            return self.async_abort(reason="exception")
+            user_input[CONF_CONNECTION] = CONF_CLOUD
+            self.data = user_input
+            return await self.async_step_final()
+        return self.async_show_form(
+            step_id=CONF_CLOUD, data_schema=CLOUD_SCHEMA, errors=errors
+        )
 
     async def async_step_final(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Complete the config flow and create the entry."""
-        _LOGGER.debug(
-            "%s - ConfigFlowHandler: async_step_final: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - ConfigFlowHandler: async_step_final: %s",
+                DOMAIN,
+                _redact(user_input),
+            )
 
         # Set unique_id based on IP address or friendly name to prevent duplicates
         unique_id = self.data.get(CONF_IP_ADDRESS) or self.data.get(
@@ -211,6 +216,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self._config_entry = config_entry
         self.data: dict[str, Any] = {}
 
+    @_abort_on_exception
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -218,158 +224,121 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         _LOGGER.debug(
             "%s - OptionsFlowHandler: async_step_init: %s", DOMAIN, user_input
         )
-        try:
-            if self._config_entry.source == config_entries.SOURCE_USER:
-                return await self.async_step_config_connection()
-            _LOGGER.warning(
-                "%s - OptionsFlowHandler: async_step_init: source not supported: %s",
-                DOMAIN,
-                self._config_entry.source,
-            )
-            return self.async_abort(reason="not_supported")
-        except Exception as e:
-            _LOGGER.error(
-                "%s - OptionsFlowHandler: async_step_init failed: %s (%s.%s)",
-                DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
-            )
-            return self.async_abort(reason="exception")
+        if self._config_entry.source == config_entries.SOURCE_USER:
+            return await self.async_step_config_connection()
+        _LOGGER.warning(
+            "%s - OptionsFlowHandler: async_step_init: source not supported: %s",
+            DOMAIN,
+            self._config_entry.source,
+        )
+        return self.async_abort(reason="not_supported")
 
+    @_abort_on_exception
     async def async_step_config_connection(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Handle connection type selection."""
-        _LOGGER.debug(
-            "%s - OptionsFlowHandler: async_step_config_connection: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            if not user_input:
-                return self.async_show_form(
-                    step_id="config_connection", data_schema=CONNECTION_SCHEMA
-                )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "%s - OptionsFlowHandler: async_step_config_connection - user_input: %s",
+                "%s - OptionsFlowHandler: async_step_config_connection: %s",
                 DOMAIN,
-                async_redact_data(user_input, REDACT_CONFIG),
+                _redact(user_input),
             )
-            if user_input[CONF_CONNECTION] == CONF_LOCAL:
-                return await self.async_step_config_local()
-            if user_input[CONF_CONNECTION] == CONF_CLOUD:
-                return await self.async_step_config_cloud()
-            return self.async_abort(reason="invalid_connection")
-        except Exception as e:
-            _LOGGER.error(
-                "%s - OptionsFlowHandler: async_step_config_connection failed: %s (%s.%s)",
+        if not user_input:
+            return self.async_show_form(
+                step_id="config_connection", data_schema=CONNECTION_SCHEMA
+            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - OptionsFlowHandler: async_step_config_connection - user_input: %s",
                 DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
+                _redact(user_input),
             )
-            return self.async_abort(reason="exception")
+        step = {
+            CONF_LOCAL: self.async_step_config_local,
+            CONF_CLOUD: self.async_step_config_cloud,
+        }.get(user_input[CONF_CONNECTION])
+        if step is None:
+            return self.async_abort(reason="invalid_connection")
+        return await step()
 
+    @_abort_on_exception
     async def async_step_config_local(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Handle local connection configuration."""
-        _LOGGER.debug(
-            "%s - OptionsFlowHandler: async_step_config_local: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            options_local_schema = await async_get_OPTIONS_LOCAL_SCHEMA(
-                self._config_entry.data
-            )
-            if not user_input:
-                return self.async_show_form(
-                    step_id="config_local", data_schema=options_local_schema
-                )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "%s - OptionsFlowHandler: async_step_config_local - user_input",
+                "%s - OptionsFlowHandler: async_step_config_local: %s",
                 DOMAIN,
+                _redact(user_input),
             )
-            user_input[CONF_CONNECTION] = CONF_LOCAL
-            self.data.update(user_input)
+        if not user_input:
+            return self.async_show_form(
+                step_id="config_local",
+                data_schema=await async_get_OPTIONS_LOCAL_SCHEMA(
+                    self._config_entry.data
+                ),
+            )
+        _LOGGER.debug(
+            "%s - OptionsFlowHandler: async_step_config_local - user_input",
+            DOMAIN,
+        )
+        user_input[CONF_CONNECTION] = CONF_LOCAL
+        self.data.update(user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "%s - OptionsFlowHandler: async_step_config_local complete: %s",
                 DOMAIN,
-                async_redact_data(user_input, REDACT_CONFIG),
-            )
-            return await self.async_step_final()
-        except Exception as e:
-            _LOGGER.error(
-                "%s - OptionsFlowHandler: async_step_config_local failed: %s (%s.%s)",
-                DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
+                _redact(user_input),
             )
-            return self.async_abort(reason="exception")
+        return await self.async_step_final()
 
+    @_abort_on_exception
     async def async_step_config_cloud(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Handle cloud connection configuration."""
-        _LOGGER.debug(
-            "%s - OptionsFlowHandler: async_step_config_cloud: %s",
-            DOMAIN,
-            async_redact_data(user_input, REDACT_CONFIG),
-        )
-        try:
-            options_cloud_schema = await async_get_OPTIONS_CLOUD_SCHEMA(
-                self._config_entry.data
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - OptionsFlowHandler: async_step_config_cloud: %s",
+                DOMAIN,
+                _redact(user_input),
             )
-            if not user_input:
-                return self.async_show_form(
-                    step_id="config_cloud", data_schema=options_cloud_schema
-                )
+        if not user_input:
+            return self.async_show_form(
+                step_id="config_cloud",
+                data_schema=await async_get_OPTIONS_CLOUD_SCHEMA(
+                    self._config_entry.data
+                ),
+            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "%s - OptionsFlowHandler: async_step_config_cloud - user_input: %s",
                 DOMAIN,
-                async_redact_data(user_input, REDACT_CONFIG),
+                _redact(user_input),
             )
-            user_input[CONF_CONNECTION] = CONF_CLOUD
-            self.data.update(user_input)
+        user_input[CONF_CONNECTION] = CONF_CLOUD
+        self.data.update(user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "%s - OptionsFlowHandler: async_step_config_cloud complete: %s",
                 DOMAIN,
-                async_redact_data(user_input, REDACT_CONFIG),
-            )
-            return await self.async_step_final()
-        except Exception as e:
-            _LOGGER.error(
-                "%s - OptionsFlowHandler: async_step_config_cloud failed: %s (%s.%s)",
-                DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
+                _redact(user_input),
             )
-            return self.async_abort(reason="exception")
+        return await self.async_step_final()
 
+    @_abort_on_exception
     async def async_step_final(self) -> config_entries.ConfigFlowResult:
         """Complete the options flow."""
-        try:
-            _LOGGER.debug("%s - OptionsFlowHandler: async_step_final", DOMAIN)
-            title = self.data.get(
-                CONF_FRIENDLY_NAME, self.data.get(CONF_IP_ADDRESS, DEFAULT_NAME)
-            )
-            if self._config_entry.state is config_entries.ConfigEntryState.SETUP_ERROR:
-                _LOGGER.debug(
-                    "%s - OptionsFlowHandler: in errorstate - trigger execution of options_update_listener",
-                    DOMAIN,
-                )
-                await options_update_listener(self.hass, self._config_entry)
-            return self.async_create_entry(title=title, data=self.data)
-        except Exception as e:
-            _LOGGER.error(
-                "%s - OptionsFlowHandler: async_step_final failed: %s (%s.%s)",
+        _LOGGER.debug("%s - OptionsFlowHandler: async_step_final", DOMAIN)
+        title = self.data.get(
+            CONF_FRIENDLY_NAME, self.data.get(CONF_IP_ADDRESS, DEFAULT_NAME)
+        )
+        if self._config_entry.state is config_entries.ConfigEntryState.SETUP_ERROR:
+            _LOGGER.debug(
+                "%s - OptionsFlowHandler: in errorstate - trigger execution of options_update_listener",
                 DOMAIN,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
-            return self.async_abort(reason="exception")
+            await options_update_listener(self.hass, self._config_entry)
+        return self.async_create_entry(title=title, data=self.data)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from importlib.metadata import version
 from typing import (
     Any,
     Final,
@@ -14,7 +16,6 @@ from homeassistant.const import (
     CONF_PASSWORD,
 )
 from homeassistant.core import HomeAssistant
-from importlib_metadata import version
 
 from .const import (
     CONF_SERIAL,
@@ -26,10 +27,22 @@ from .utils import (
 
 REDACT_CONFIG = {CONF_IP_ADDRESS, CONF_PASSWORD, CONF_SERIAL}
 REDACT_ALLPROPS = {"wifis", "scan", "data", "dll", "cak", "ocppck", "ocppcc", "ocppsc"}
+_CHARGER_INFO: Final = ("connected", "allPropsInitialized", "name", "firmware")
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _module_versions() -> dict[str, str]:
+    """Return the versions of the used python modules (looked up once)."""
+    return {
+        "wattpilot_version": version("wattpilot"),
+        "wattpilot_file": wattpilot.__file__,
+        "pyyaml": version("pyyaml"),
+        "packaging": version("packaging"),
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,  # noqa: ARG001
     entry: WattpilotConfigEntry,
@@ -46,19 +59,16 @@ async def async_get_config_entry_diagnostics(
             entry.entry_id,
         )
         diag["config"] = async_redact_data(entry.as_dict(), REDACT_CONFIG)
-    except Exception as e:
-        _LOGGER.error(
-            "%s - diagnostics: Adding config entry configuration failed: %s (%s.%s)",
+    except Exception:
+        _LOGGER.exception(
+            "%s - diagnostics: Adding config entry configuration failed",
             entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
         )
 
-    # Add charger properties from runtime_data
+    # Add charger properties and info from runtime_data
     try:
         _LOGGER.debug(
-            "%s - diagnostics: Add charger properties to output",
+            "%s - diagnostics: Add charger properties and info to output",
             entry.entry_id,
         )
         charger = entry.runtime_data.charger
@@ -68,35 +78,16 @@ async def async_get_config_entry_diagnostics(
             )
         else:
             diag["charger_properties"] = "Charger not available or not initialized"
-    except Exception as e:
-        _LOGGER.error(
-            "%s - diagnostics: Adding charger properties failed: %s (%s.%s)",
-            entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-
-    # Add charger info
-    try:
-        charger = entry.runtime_data.charger
         if charger:
-            diag["charger_info"] = {
-                "connected": getattr(charger, "connected", None),
-                "allPropsInitialized": getattr(charger, "allPropsInitialized", None),
-                "name": getattr(charger, "name", None),
-                "serial": async_redact_data(
-                    {"serial": getattr(charger, "serial", None)}, {"serial"}
-                ),
-                "firmware": getattr(charger, "firmware", None),
-            }
-    except Exception as e:
-        _LOGGER.error(
-            "%s - diagnostics: Adding charger info failed: %s (%s.%s)",
+            info = {attr: getattr(charger, attr, None) for attr in _CHARGER_INFO}
+            info["serial"] = async_redact_data(
+                {"serial": getattr(charger, "serial", None)}, {"serial"}
+            )
+            diag["charger_info"] = info
+    except Exception:
+        _LOGGER.exception(
+            "%s - diagnostics: Adding charger properties and info failed",
             entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
         )
 
     # Add python modules versions
@@ -105,21 +96,11 @@ async def async_get_config_entry_diagnostics(
             "%s - diagnostics: Add python modules version",
             entry.entry_id,
         )
-        diag["modules"] = {
-            "wattpilot_version": version("wattpilot"),
-            "wattpilot_file": wattpilot.__file__,
-            "pyyaml": version("pyyaml"),
-            "importlib_metadata": version("importlib_metadata"),
-            "aiofiles": version("aiofiles"),
-            "packaging": version("packaging"),
-        }
-    except Exception as e:
-        _LOGGER.error(
-            "%s - diagnostics: Add python modules version failed: %s (%s.%s)",
+        diag["modules"] = dict(_module_versions())
+    except Exception:
+        _LOGGER.exception(
+            "%s - diagnostics: Add python modules version failed",
             entry.entry_id,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
         )
 
     return diag
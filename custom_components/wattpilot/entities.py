@@ -23,14 +23,103 @@ from .const import (
 from .utils import (
     GetChargerProp,
     async_GetChargerProp,
+    async_GetPlatformYaml,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
     from .types import WattpilotConfigEntry
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 
+async def async_setup_platform_entities(
+    hass: HomeAssistant,
+    entry: WattpilotConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    platform: str,
+    entity_cls: type[ChargerPlatformEntity],
+    *,
+    force_source: str | None = None,
+    required_keys: tuple[str, ...] = ("id",),
+) -> None:
+    """Async: Set up the entities of a platform from its static yaml configuration."""
+    _LOGGER.debug("Setting up %s platform entry: %s", platform, entry.entry_id)
+    entities: list[ChargerPlatformEntity] = []
+
+    try:
+        _LOGGER.debug(
+            "%s - async_setup_entry %s: Reading static yaml configuration",
+            entry.entry_id,
+            platform,
+        )
+        yaml_cfg = await async_GetPlatformYaml(hass, platform)
+    except Exception:
+        _LOGGER.exception(
+            "%s - async_setup_entry %s: Reading static yaml configuration failed",
+            entry.entry_id,
+            platform,
+        )
+        return
+
+    try:
+        runtime_data = entry.runtime_data
+        charger = runtime_data.charger
+        push_entities = runtime_data.push_entities
+    except Exception:
+        _LOGGER.exception(
+            "%s - async_setup_entry %s: Getting charger and push entities from runtime_data failed",
+            entry.entry_id,
+            platform,
+        )
+        return
+
+    for entity_cfg in yaml_cfg.get(platform, []):
+        try:
+            missing = [key for key in required_keys if entity_cfg.get(key) is None]
+            if force_source is None and entity_cfg.get("source") is None:
+                missing.append("source")
+            if missing:
+                _LOGGER.error(
+                    "%s - async_setup_entry %s: Invalid yaml configuration - no %s: %s",
+                    entry.entry_id,
+                    platform,
+                    ", ".join(missing),
+                    entity_cfg,
+                )
+                continue
+            entity = entity_cls(hass, entry, entity_cfg, charger, source=force_source)
+            if entity._init_failed:
+                continue
+            entities.append(entity)
+        except Exception:
+            _LOGGER.exception(
+                "%s - async_setup_entry %s: Reading static yaml configuration failed",
+                entry.entry_id,
+                platform,
+            )
+            return
+
+    # Register all push entities of the platform in one go
+    push_entities.update(
+        (entity._identifier, entity)
+        for entity in entities
+        if entity._source == "property"
+    )
+    _LOGGER.info(
+        "%s - async_setup_entry: setup %s %s entities",
+        entry.entry_id,
+        len(entities),
+        platform,
+    )
+    if not entities:
+        return
+    async_add_entities(entities)
+
+
 class ChargerPlatformEntity(Entity):
     """Base class for Fronius Wattpilot integration."""
 
@@ -41,10 +130,14 @@ class ChargerPlatformEntity(Entity):
         self,
         hass: HomeAssistant,
         entry: WattpilotConfigEntry,
-        entity_cfg: dict[str, Any],
+        entity_cfg: Mapping[str, Any],
         charger: Any,
+        *,
+        source: str | None = None,
     ) -> None:
-        """Initialize the object."""
+        """Initialize the object (source overrides the configured entity source)."""
+        # Cleared again once all checks below have passed
+        self._init_failed = True
         try:
             self._charger_id = str(
                 entry.data.get(
@@ -55,7 +148,10 @@ class ChargerPlatformEntity(Entity):
             _LOGGER.debug("%s - %s: __init__", self._charger_id, self._identifier)
 
             self._charger = charger
-            self._source = entity_cfg.get("source", "property")
+            # The entity_cfg is shared through the yaml cache - never write into it
+            self._source = (
+                entity_cfg.get("source", "property") if source is None else source
+            )
             self._namespace_id = int(entity_cfg.get("namespace_id", 0))
             self._default_state = entity_cfg.get("default_state")
             self._entity_cfg = entity_cfg
@@ -63,7 +159,6 @@ class ChargerPlatformEntity(Entity):
             self._entry = entry
             self.hass = hass
 
-            self._init_failed = True
             self._fw_supported = self._check_firmware_supported()
             if self._fw_supported is not True:
                 return
@@ -144,14 +239,11 @@ class ChargerPlatformEntity(Entity):
             )
             if self._init_failed:
                 return
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: __init__ failed: %s (%s.%s)",
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: __init__ failed",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
             return
 
@@ -368,14 +460,11 @@ class ChargerPlatformEntity(Entity):
             if enabled is False or str(enabled).lower() == "false":
                 return False
             return True
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: entity_registry_enabled_default failed - default enable: %s (%s.%s)",
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: entity_registry_enabled_default failed - default enable",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
             return True
 
@@ -426,14 +515,11 @@ class ChargerPlatformEntity(Entity):
                     self._charger_id,
                     self._identifier,
                 )
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: async_update failed: %s (%s.%s)",
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: async_update failed",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
 
     async def _async_update_validate_property(self, state: Any = None) -> Any | None:
@@ -478,14 +564,11 @@ class ChargerPlatformEntity(Entity):
                         attr_index = attr_entry.split(":")[1]
                         self._attributes[attr_id] = state_list[int(attr_index)]
             return state
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: _async_update_validate_property failed: %s (%s.%s)",
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: _async_update_validate_property failed",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
             return None
 
@@ -535,14 +618,11 @@ class ChargerPlatformEntity(Entity):
             if state is not None:
                 setattr(self, self._state_attr, state)
                 self.async_write_ha_state()
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: async_local_poll failed: %s (%s.%s)",
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: async_local_poll failed",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
 
     async def async_local_push(self, state: Any = None, initwait: bool = False) -> None:
@@ -577,11 +657,8 @@ class ChargerPlatformEntity(Entity):
                 await asyncio.sleep(5)
                 await self.async_local_push(state, True)
             else:
-                _LOGGER.error(
-                    "%s - %s: async_local_push failed: %s (%s.%s)",
+                _LOGGER.exception(
+                    "%s - %s: async_local_push failed",
                     self._charger_id,
                     self._identifier,
-                    str(e),
-                    e.__class__.__module__,
-                    type(e).__name__,
                 )
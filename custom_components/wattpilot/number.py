@@ -2,20 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
 
-import aiofiles
-import yaml
 from homeassistant.components.number import (
     UNIT_CONVERTERS,
     NumberEntity,
 )
 from homeassistant.core import HomeAssistant
 
-from .entities import ChargerPlatformEntity
+from .entities import ChargerPlatformEntity, async_setup_platform_entities
 from .utils import async_SetChargerProp
 
 if TYPE_CHECKING:
@@ -26,6 +22,13 @@ if TYPE_CHECKING:
 _LOGGER: Final = logging.getLogger(__name__)
 PLATFORM = "number"
 
+# Optional numeric yaml options and the entity attributes they are applied to
+_NATIVE_LIMITS: Final = (
+    ("native_min_value", "_attr_native_min_value"),
+    ("native_max_value", "_attr_native_max_value"),
+    ("native_step", "_attr_native_step"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,111 +36,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the number platform."""
-    _LOGGER.debug("Setting up %s platform entry: %s", PLATFORM, entry.entry_id)
-    entities: list[ChargerNumber] = []
-
-    try:
-        _LOGGER.debug(
-            "%s - async_setup_entry %s: Reading static yaml configuration",
-            entry.entry_id,
-            PLATFORM,
-        )
-        yaml_path = Path(__file__).parent / f"{PLATFORM}.yaml"
-        async with aiofiles.open(yaml_path) as y:
-            yaml_cfg = yaml.safe_load(await y.read())
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry %s: Reading static yaml configuration failed: %s (%s.%s)",
-            entry.entry_id,
-            PLATFORM,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        return
-
-    try:
-        _LOGGER.debug(
-            "%s - async_setup_entry %s: Getting charger instance from runtime_data",
-            entry.entry_id,
-            PLATFORM,
-        )
-        charger = entry.runtime_data.charger
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry %s: Getting charger instance from runtime_data failed: %s (%s.%s)",
-            entry.entry_id,
-            PLATFORM,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        return
-
-    try:
-        _LOGGER.debug(
-            "%s - async_setup_entry %s: Getting push entities dict from runtime_data",
-            entry.entry_id,
-            PLATFORM,
-        )
-        push_entities = entry.runtime_data.push_entities
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry %s: Getting push entities dict from runtime_data failed: %s (%s.%s)",
-            entry.entry_id,
-            PLATFORM,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        return
-
-    for entity_cfg in yaml_cfg.get(PLATFORM, []):
-        try:
-            entity_cfg["source"] = "property"
-            if "id" not in entity_cfg or entity_cfg["id"] is None:
-                _LOGGER.error(
-                    "%s - async_setup_entry %s: Invalid yaml configuration - no id: %s",
-                    entry.entry_id,
-                    PLATFORM,
-                    entity_cfg,
-                )
-                continue
-            if "source" not in entity_cfg or entity_cfg["source"] is None:
-                _LOGGER.error(
-                    "%s - async_setup_entry %s: Invalid yaml configuration - no source: %s",
-                    entry.entry_id,
-                    PLATFORM,
-                    entity_cfg,
-                )
-                continue
-            entity = ChargerNumber(hass, entry, entity_cfg, charger)
-            if getattr(entity, "_init_failed", True):
-                continue
-            entities.append(entity)
-            if entity._source == "property":
-                push_entities[entity._identifier] = entity
-            await asyncio.sleep(0)
-        except Exception as e:
-            _LOGGER.error(
-                "%s - async_setup_entry %s: Reading static yaml configuration failed: %s (%s.%s)",
-                entry.entry_id,
-                PLATFORM,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
-            )
-            return
-
-    _LOGGER.info(
-        "%s - async_setup_entry: setup %s %s entities",
-        entry.entry_id,
-        len(entities),
+    await async_setup_platform_entities(
+        hass,
+        entry,
+        async_add_entities,
         PLATFORM,
+        ChargerNumber,
+        force_source="property",
     )
-    if not entities:
-        return
-    async_add_entities(entities)
 
 
 class ChargerNumber(ChargerPlatformEntity, NumberEntity):
@@ -147,28 +53,18 @@ class ChargerNumber(ChargerPlatformEntity, NumberEntity):
 
     def _init_platform_specific(self) -> None:
         """Platform specific init actions."""
-        self._attr_native_unit_of_measurement = self._entity_cfg.get(
-            "unit_of_measurement", None
-        )
+        cfg = self._entity_cfg
+        uom = cfg.get("unit_of_measurement")
+        self._attr_native_unit_of_measurement = uom
         unit_converter = UNIT_CONVERTERS.get(self._attr_device_class)
-        if (
-            unit_converter is not None
-            and self._attr_native_unit_of_measurement in unit_converter.VALID_UNITS
-        ):
-            self._attr_suggested_unit_of_measurement = self._entity_cfg.get(
-                "unit_of_measurement", None
-            )
+        if unit_converter is not None and uom in unit_converter.VALID_UNITS:
+            self._attr_suggested_unit_of_measurement = uom
 
-        n = self._entity_cfg.get("native_min_value", None)
-        if n is not None:
-            self._attr_native_min_value = float(n)
-        n = self._entity_cfg.get("native_max_value", None)
-        if n is not None:
-            self._attr_native_max_value = float(n)
-        n = self._entity_cfg.get("native_step", None)
-        if n is not None:
-            self._attr_native_step = float(n)
-        self._attr_mode = self._entity_cfg.get("mode", None)
+        for cfg_key, attr_name in _NATIVE_LIMITS:
+            n = cfg.get(cfg_key)
+            if n is not None:
+                setattr(self, attr_name, float(n))
+        self._attr_mode = cfg.get("mode")
 
     def _get_platform_specific_state(self) -> Any:
         """Platform specific init actions."""
@@ -199,12 +95,9 @@ class ChargerNumber(ChargerPlatformEntity, NumberEntity):
             await async_SetChargerProp(
                 self._charger, self._identifier, value, force_type=self._set_type
             )
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: update failed: %s (%s.%s)",
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: update failed",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
@@ -3,30 +3,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from homeassistant.config_entries import ConfigEntry
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from .entities import ChargerPlatformEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class WattpilotRuntimeData:
     """Runtime data for the Wattpilot integration."""
 
     charger: Any  # Wattpilot client instance
     push_entities: dict[str, ChargerPlatformEntity] = field(default_factory=dict)
-    params: dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)  # read-only entry data
     debug_properties: bool = False
-    options_update_listener: Any | None = None
-    property_updates_callback: Any | None = None
 
 
 type WattpilotConfigEntry = ConfigEntry[WattpilotRuntimeData]
 
 
-class EntityConfig:
+class EntityConfig(TypedDict, total=False):
     """Type hints for entity configuration from YAML."""
 
     id: str
@@ -5,27 +5,19 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from pathlib import Path
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Final
 
-import aiofiles
-import yaml
 from homeassistant.components.update import (
     UpdateEntity,
     UpdateEntityFeature,
 )
-from homeassistant.const import (
-    CONF_PARAMS,
-    CONF_TIMEOUT,
-)
+from homeassistant.const import CONF_TIMEOUT
 from homeassistant.core import HomeAssistant
 from packaging.version import Version
 
-from .const import (
-    DEFAULT_TIMEOUT,
-    DOMAIN,
-)
-from .entities import ChargerPlatformEntity
+from .const import DEFAULT_TIMEOUT
+from .entities import ChargerPlatformEntity, async_setup_platform_entities
 from .utils import (
     GetChargerProp,
     async_SetChargerProp,
@@ -38,6 +30,50 @@ if TYPE_CHECKING:
 
 _LOGGER: Final = logging.getLogger(__name__)
 PLATFORM = "update"
+# Update entities need the installed version and install trigger props as well
+_REQUIRED_KEYS: Final = ("id", "id_installed", "id_trigger")
+
+# Reduces charger version names like "v1.2.3-beta1 (test)" to "1.2.3beta1"
+_VERSION_CLEAN_RE: Final = re.compile(
+    r"^(v|ver|vers|version)*\s*\.*\s*([0-9.x]*)\s*-?\s*((alpha|beta|dev|rc|post|a|b|release)+[0-9]*)?\s*.*$"
+)
+_VERSION_CHARS: Final = frozenset("0123456789.")
+
+
+@lru_cache(maxsize=512)
+def _clean_version(version: str) -> str:
+    """Return the cleaned, comparable form of a charger version name."""
+    cleaned = version.lower().replace("x", "0")
+    # Plain "[v]1.2.3" names are already clean apart from the prefix
+    plain = cleaned.removeprefix("v")
+    if plain[:1].isdigit() and _VERSION_CHARS.issuperset(plain):
+        return plain
+    return _VERSION_CLEAN_RE.sub(r"\2\3", cleaned)
+
+
+@lru_cache(maxsize=128)
+def _versions_dict(v_list: tuple[str, ...]) -> dict[str, str]:
+    """Map cleaned to named versions (shared read-only by all update entities)."""
+    return {_clean_version(v): v for v in v_list}
+
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Version:
+    """Return the parsed packaging Version of a cleaned version name."""
+    return Version(version)
+
+
+def _pack_version(version: str) -> int | None:
+    """Pack a plain MAJOR[.MINOR[.PATCH]] version into a comparable int."""
+    parts = version.split(".")
+    if len(parts) > 3:
+        return None
+    packed = 0
+    for part in (*parts, "0", "0")[:3]:
+        if not (part.isascii() and part.isdigit()) or len(part) > 6:
+            return None
+        packed = (packed << 21) | int(part)
+    return packed
 
 
 async def async_setup_entry(
@@ -46,127 +82,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the update platform."""
-    _LOGGER.debug("Setting up %s platform entry: %s", PLATFORM, entry.entry_id)
-    entities: list[ChargerUpdate] = []
-
-    try:
-        _LOGGER.debug(
-            "%s - async_setup_entry %s: Reading static yaml configuration",
-            entry.entry_id,
-            PLATFORM,
-        )
-        yaml_path = Path(__file__).parent / f"{PLATFORM}.yaml"
-        async with aiofiles.open(yaml_path) as y:
-            yaml_cfg = yaml.safe_load(await y.read())
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry %s: Reading static yaml configuration failed: %s (%s.%s)",
-            entry.entry_id,
-            PLATFORM,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        return
-
-    try:
-        _LOGGER.debug(
-            "%s - async_setup_entry %s: Getting charger instance from runtime_data",
-            entry.entry_id,
-            PLATFORM,
-        )
-        charger = entry.runtime_data.charger
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry %s: Getting charger instance from runtime_data failed: %s (%s.%s)",
-            entry.entry_id,
-            PLATFORM,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        return
-
-    try:
-        _LOGGER.debug(
-            "%s - async_setup_entry %s: Getting push entities dict from runtime_data",
-            entry.entry_id,
-            PLATFORM,
-        )
-        push_entities = entry.runtime_data.push_entities
-    except Exception as e:
-        _LOGGER.error(
-            "%s - async_setup_entry %s: Getting push entities dict from runtime_data failed: %s (%s.%s)",
-            entry.entry_id,
-            PLATFORM,
-            str(e),
-            e.__class__.__module__,
-            type(e).__name__,
-        )
-        return
-
-    for entity_cfg in yaml_cfg[PLATFORM]:
-        try:
-            entity_cfg["source"] = "property"
-            if "id" not in entity_cfg or entity_cfg["id"] is None:
-                _LOGGER.error(
-                    "%s - async_setup_entry %s: Invalid yaml configuration - no id: %s",
-                    entry.entry_id,
-                    PLATFORM,
-                    entity_cfg,
-                )
-                continue
-            if "id_installed" not in entity_cfg or entity_cfg["id_installed"] is None:
-                _LOGGER.error(
-                    "%s - async_setup_entry %s: Invalid yaml configuration - no id_installed: %s",
-                    entry.entry_id,
-                    PLATFORM,
-                    entity_cfg,
-                )
-                continue
-            if "id_trigger" not in entity_cfg or entity_cfg["id_trigger"] is None:
-                _LOGGER.error(
-                    "%s - async_setup_entry %s: Invalid yaml configuration - no id_trigger: %s",
-                    entry.entry_id,
-                    PLATFORM,
-                    entity_cfg,
-                )
-                continue
-            if "source" not in entity_cfg or entity_cfg["source"] is None:
-                _LOGGER.error(
-                    "%s - async_setup_entry %s: Invalid yaml configuration - no source: %s",
-                    entry.entry_id,
-                    PLATFORM,
-                    entity_cfg,
-                )
-                continue
-            entity = ChargerUpdate(hass, entry, entity_cfg, charger)
-            if getattr(entity, "_init_failed", True):
-                continue
-            entities.append(entity)
-            if entity._source == "property":
-                push_entities[entity._identifier] = entity
-            await asyncio.sleep(0)
-        except Exception as e:
-            _LOGGER.error(
-                "%s - async_setup_entry %s: Reading static yaml configuration failed: %s (%s.%s)",
-                entry.entry_id,
-                PLATFORM,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
-            )
-            return
-
-    _LOGGER.info(
-        "%s - async_setup_entry: setup %s %s entities",
-        entry.entry_id,
-        len(entities),
+    await async_setup_platform_entities(
+        hass,
+        entry,
+        async_add_entities,
         PLATFORM,
+        ChargerUpdate,
+        force_source="property",
+        required_keys=_REQUIRED_KEYS,
     )
-    if not entities:
-        return
-    async_add_entities(entities)
 
 
 class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
@@ -184,6 +108,10 @@ class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
         self._identifier_installed = self._entity_cfg.get("id_installed")
         self._identifier_trigger = self._entity_cfg.get("id_trigger", None)
         self._identifier_status = self._entity_cfg.get("id_status", None)
+        # The charger needs to download, install and restart within this time
+        self._install_timeout = 4 * self._entry.runtime_data.params.get(
+            CONF_TIMEOUT, DEFAULT_TIMEOUT
+        )
 
         self._attr_installed_version = GetChargerProp(
             self._charger, self._identifier_installed, None
@@ -205,9 +133,12 @@ class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
         self, v_list: list[str] | str | None = None, return_latest: bool = False
     ) -> str | None:
         """Get the latest update version of available versions."""
-        _LOGGER.debug(
-            "%s - %s: _update_available_versions", self._charger_id, self._identifier
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - %s: _update_available_versions",
+                self._charger_id,
+                self._identifier,
+            )
         try:
             if v_list is None:
                 v_list = GetChargerProp(self._charger, self._identifier, None)
@@ -222,17 +153,21 @@ class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
             elif not isinstance(v_list, list):
                 v_list = [v_list]
             self._available_versions = self._get_versions_dict(v_list)
-            latest = list(self._available_versions.keys())
-            latest.sort(key=Version)
-            return latest[-1]
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: _update_available_versions failed: %s (%s.%s)",
+            # Firmware versions are mostly plain numbers - only fall back to the
+            # (slower) packaging Version for pre-releases and other exotic names
+            packed = {v: _pack_version(v) for v in self._available_versions}
+            if packed and None not in packed.values():
+                return max(packed, key=packed.__getitem__)
+            return max(
+                self._available_versions,
+                key=_parse_version,
+                default=self._dummy_version,
+            )
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: _update_available_versions failed",
                 self._charger_id,
                 self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
             )
             if return_latest:
                 return self._dummy_version
@@ -240,26 +175,15 @@ class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
 
     def _get_versions_dict(self, v_list: list[str]) -> dict[str, str]:
         """Create a dict with clean and named versions."""
-        _LOGGER.debug("%s - %s: _get_versions_dict", self._charger_id, self._identifier)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - %s: _get_versions_dict", self._charger_id, self._identifier
+            )
         try:
-            versions: dict[str, str] = {}
-            for v in v_list:
-                c = (v.lower()).replace("x", "0")
-                c = re.sub(
-                    r"^(v|ver|vers|version)*\s*\.*\s*([0-9.x]*)\s*-?\s*((alpha|beta|dev|rc|post|a|b|release)+[0-9]*)?\s*.*$",
-                    r"\2\3",
-                    c,
-                )
-                versions[c] = v
-            return versions
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: _get_versions_dict failed: %s (%s.%s)",
-                self._charger_id,
-                self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
+            return _versions_dict(tuple(v_list))
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: _get_versions_dict failed", self._charger_id, self._identifier
             )
             return {}
 
@@ -301,25 +225,12 @@ class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
                 force_type=self._set_type,
             )
 
-            # Get timeout from config
-            timeout = DEFAULT_TIMEOUT
-            entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, None)
-            if entry_data is not None:
-                config_params = entry_data.get(CONF_PARAMS, None)
-                if config_params is not None:
-                    timeout = config_params.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
-            timeout = timeout * 4
-
-            timer = 0
-            while timeout > timer and self._charger.connected:
-                await asyncio.sleep(1)
-                timer += 1
-            if self._charger.connected:
+            if not await self._async_wait_connected(connected=False):
                 _LOGGER.error(
                     "%s - %s: async_install: update timeout during update install: %s seconds",
                     self._charger_id,
                     self._identifier,
-                    timeout,
+                    self._install_timeout,
                 )
                 return
             _LOGGER.debug(
@@ -327,47 +238,44 @@ class ChargerUpdate(ChargerPlatformEntity, UpdateEntity):
                 self._charger_id,
                 self._identifier,
             )
-            timer = 0
-            while timeout > timer and not self._charger.connected:
-                await asyncio.sleep(1)
-                timer += 1
-            if not self._charger.connected:
+            if not await self._async_wait_connected(connected=True):
                 _LOGGER.error(
                     "%s - %s: async_install: update timeout during charger restart: %s seconds",
                     self._charger_id,
                     self._identifier,
-                    timeout,
+                    self._install_timeout,
                 )
                 return
-        except Exception as e:
-            _LOGGER.error(
-                "%s - %s: async_install failed: %s (%s.%s)",
-                self._charger_id,
-                self._identifier,
-                str(e),
-                e.__class__.__module__,
-                type(e).__name__,
+        except Exception:
+            _LOGGER.exception(
+                "%s - %s: async_install failed", self._charger_id, self._identifier
             )
 
+    async def _async_wait_connected(self, *, connected: bool) -> bool:
+        """Async: Wait until the charger reaches the connection state or times out."""
+        delay = 0.1
+        try:
+            async with asyncio.timeout(self._install_timeout):
+                while bool(self._charger.connected) is not connected:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 1.5, 2.0)
+        except TimeoutError:
+            return False
+        return True
+
     async def _async_update_validate_platform_state(
         self, state: Any = None
     ) -> str | None:
         """Async: Validate the given state for update specific requirements."""
-        _LOGGER.debug(
-            "%s - %s: _async_update_validate_platform_state",
-            self._charger_id,
-            self._identifier,
-        )
         self._attr_installed_version = GetChargerProp(
             self._charger, self._identifier_installed, None
         )
-        state = await self.hass.async_add_executor_job(
-            self._update_available_versions, state, True
-        )
-        _LOGGER.debug(
-            "%s - %s: _async_update_validate_platform_state: state: %s",
-            self._charger_id,
-            self._identifier,
-            state,
-        )
+        state = self._update_available_versions(state, return_latest=True)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - %s: _async_update_validate_platform_state: state: %s",
+                self._charger_id,
+                self._identifier,
+                state,
+            )
         return state
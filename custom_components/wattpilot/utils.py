@@ -6,12 +6,13 @@ import asyncio
 import json
 import logging
 import types
-from typing import Final
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
 
+import yaml
 from homeassistant.const import (
     CONF_FRIENDLY_NAME,
     CONF_IP_ADDRESS,
-    CONF_PARAMS,
     CONF_PASSWORD,
     CONF_TIMEOUT,
 )
@@ -22,9 +23,7 @@ from .const import (
     CONF_CHARGER,
     CONF_CLOUD,
     CONF_CONNECTION,
-    CONF_DBG_PROPS,
     CONF_LOCAL,
-    CONF_PUSH_ENTITIES,
     CONF_SERIAL,
     DEFAULT_NAME,
     DEFAULT_TIMEOUT,
@@ -33,8 +32,25 @@ from .const import (
     EVENT_PROPS_ID,
 )
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .types import WattpilotRuntimeData
+
 _LOGGER: Final = logging.getLogger(__name__)
 
+# Parsed static platform yaml configurations - the files do not change at runtime
+_PLATFORM_YAML: dict[str, dict[str, Any]] = {}
+_PLATFORM_YAML_LOCK: Final = asyncio.Lock()
+
+# Lower case string values that async_SetChargerProp sends as booleans
+_BOOL_STRINGS: Final = frozenset({"false", "true"})
+
 import os
 import sys
 
@@ -171,16 +187,21 @@ async def async_PropertyDebug(
 
 
 def PropertyUpdateHandler(
-    hass: HomeAssistant, entry_id: str, identifier: str, value: str
+    hass: HomeAssistant,
+    entry_id: str,
+    runtime_data: WattpilotRuntimeData,
+    identifier: str,
+    value: str,
 ) -> None:
     """Watches on property updates and executes corresponding action"""
     try:
         # _LOGGER.debug("%s - PropertyUpdateHandler: 'self' execute async", entry_id)
-        if entry_id in hass.data[DOMAIN]:
-            asyncio.run_coroutine_threadsafe(
-                async_PropertyUpdateHandler(hass, entry_id, identifier, value),
-                hass.loop,
-            )
+        asyncio.run_coroutine_threadsafe(
+            async_PropertyUpdateHandler(
+                hass, entry_id, runtime_data, identifier, value
+            ),
+            hass.loop,
+        )
     except Exception as e:
         _LOGGER.error(
             "%s - PropertyUpdateHandler: Could not 'self' execute async: %s (%s.%s)",
@@ -192,22 +213,23 @@ def PropertyUpdateHandler(
 
 
 async def async_PropertyUpdateHandler(
-    hass: HomeAssistant, entry_id: str, identifier: str, value: str
+    hass: HomeAssistant,
+    entry_id: str,
+    runtime_data: WattpilotRuntimeData,
+    identifier: str,
+    value: str,
 ) -> None:
     """Asnyc: Watches on property updates and executes corresponding action"""
     try:
-        # _LOGGER.debug("%s - async_PropertyUpdateHandler: get entry_data", entry_id)
-        entry_data = hass.data[DOMAIN][entry_id]
-
-        entity = entry_data[CONF_PUSH_ENTITIES].get(identifier, None)
+        entity = runtime_data.push_entities.get(identifier)
         if entity is not None:
             hass.async_create_task(entity.async_local_push(value))
 
         if identifier in EVENT_PROPS:
+            params = runtime_data.params
             charger_id = str(
-                entry_data[CONF_PARAMS].get(
-                    CONF_FRIENDLY_NAME,
-                    entry_data[CONF_PARAMS].get(CONF_IP_ADDRESS, DEFAULT_NAME),
+                params.get(
+                    CONF_FRIENDLY_NAME, params.get(CONF_IP_ADDRESS, DEFAULT_NAME)
                 )
             )
             data = {
@@ -218,9 +240,9 @@ async def async_PropertyUpdateHandler(
             }
             hass.bus.fire(EVENT_PROPS_ID, data)
 
-        if entry_data.get(CONF_DBG_PROPS, False):
+        if runtime_data.debug_properties:
             hass.async_create_task(
-                async_PropertyDebug(identifier, value, entry_data.get(CONF_DBG_PROPS))
+                async_PropertyDebug(identifier, value, runtime_data.debug_properties)
             )
     except Exception as e:
         _LOGGER.error(
@@ -347,7 +369,7 @@ async def async_SetChargerProp(
         )
         if force_type == "str":
             v = str(value)
-        elif str(value).lower() in ["false", "true"] or force_type == "bool":
+        elif str(value).lower() in _BOOL_STRINGS or force_type == "bool":
             v = json.loads(str(value).lower())
         elif str(value).isnumeric() or force_type == "int":
             v = int(value)
@@ -385,6 +407,52 @@ async def async_SetChargerProp(
         return False
 
 
+def _LoadPlatformYaml(platform: str) -> dict[str, Any]:
+    """Read and parse the static yaml configuration of a platform (blocking)"""
+    yaml_path = Path(__file__).resolve().parent / f"{platform}.yaml"
+    with yaml_path.open("rb") as y:
+        return yaml.load(y, Loader=SafeLoader)
+
+
+def _LoadPlatformYamls(platforms: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Read and parse the static yaml configurations of several platforms (blocking)"""
+    return {platform: _LoadPlatformYaml(platform) for platform in platforms}
+
+
+async def async_GetPlatformYaml(hass: HomeAssistant, platform: str) -> dict[str, Any]:
+    """Async: return the static yaml configuration of a platform (parsed once)"""
+    yaml_cfg = _PLATFORM_YAML.get(platform)
+    if yaml_cfg is not None:
+        return yaml_cfg
+    async with _PLATFORM_YAML_LOCK:
+        yaml_cfg = _PLATFORM_YAML.get(platform)
+        if yaml_cfg is None:
+            yaml_cfg = await hass.async_add_executor_job(_LoadPlatformYaml, platform)
+            _PLATFORM_YAML[platform] = yaml_cfg
+    return yaml_cfg
+
+
+async def async_PreloadPlatformYaml(
+    hass: HomeAssistant, platforms: Iterable[str]
+) -> None:
+    """Async: parse the static yaml configurations of several platforms in one go"""
+    try:
+        async with _PLATFORM_YAML_LOCK:
+            missing = [p for p in platforms if p not in _PLATFORM_YAML]
+            if missing:
+                _PLATFORM_YAML.update(
+                    await hass.async_add_executor_job(_LoadPlatformYamls, missing)
+                )
+    except Exception as e:
+        _LOGGER.warning(
+            "%s - async_PreloadPlatformYaml: preloading yaml configuration failed: %s (%s.%s)",
+            DOMAIN,
+            str(e),
+            e.__class__.__module__,
+            type(e).__name__,
+        )
+
+
 async def async_GetDataStoreFromDeviceID(hass: HomeAssistant, device_id: str):
     """Async: return the data store for a specific device_id"""
     try: